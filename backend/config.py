@@ -51,6 +51,9 @@ class AdvancedSettings(BaseSettings):
     SOMNIA_CHAIN_ID: int = Field(50312, env="SOMNIA_CHAIN_ID")
     SOMNIA_SYMBOL: str = Field("STT", env="SOMNIA_SYMBOL")
     SOMNIA_EXPLORER_URL: str = Field("https://shannon-explorer.somnia.network/", env="SOMNIA_EXPLORER_URL")
+    SOMNIA_INDEXER_URL: Optional[str] = Field(None, env="SOMNIA_INDEXER_URL")
+    SOMNIA_POOL_SIZE: int = Field(32, env="SOMNIA_POOL_SIZE")
+    SOMNIA_BATCH_SIZE: int = Field(10, env="SOMNIA_BATCH_SIZE")
 
     # Enhanced AI/ML Settings (Groq Only)
     AI_PROVIDER: str = Field("groq", env="AI_PROVIDER")
@@ -63,6 +66,7 @@ class AdvancedSettings(BaseSettings):
     AI_MAX_TOKENS: int = Field(800, env="AI_MAX_TOKENS")
     AI_MAX_CONTEXT_LENGTH: int = Field(8000, env="AI_MAX_CONTEXT_LENGTH")
     AI_TIMEOUT: int = Field(30, env="AI_TIMEOUT")
+    AI_STREAMING: bool = Field(False, env="AI_STREAMING")
     
     # Advanced AI Features
     AI_CONFIRMATION_FLOWS: bool = Field(True, env="AI_CONFIRMATION_FLOWS")
@@ -400,6 +404,7 @@ class AdvancedEnvironmentManager:
             "temperature": self.settings.AI_TEMPERATURE,
             "max_tokens": self.settings.AI_MAX_TOKENS,
             "timeout": self.settings.AI_TIMEOUT,
+            "streaming": self.settings.AI_STREAMING,
             "max_context_length": self.settings.AI_MAX_CONTEXT_LENGTH
         }
 
@@ -553,6 +558,9 @@ SOMNIA_RPC_URL=https://dream-rpc.somnia.network/
 SOMNIA_CHAIN_ID=50312
 SOMNIA_SYMBOL=STT
 SOMNIA_EXPLORER_URL=https://shannon-explorer.somnia.network/
+SOMNIA_INDEXER_URL=https://shannon-explorer.somnia.network/api
+SOMNIA_POOL_SIZE=32
+SOMNIA_BATCH_SIZE=10
 
 # ==================== AI CONFIGURATION ====================
 AI_PROVIDER=groq
@@ -563,6 +571,7 @@ AI_TEMPERATURE=0.1
 AI_MAX_TOKENS=800
 AI_MAX_CONTEXT_LENGTH=8000
 AI_TIMEOUT=30
+AI_STREAMING=false
 
 # Advanced AI Features
 AI_CONFIRMATION_FLOWS=true
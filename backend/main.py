@@ -6,7 +6,7 @@ AI-Powered Wallet Agent for Somnia Blockchain - Sophisticated Version
 
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 import uvicorn
@@ -20,7 +20,7 @@ from datetime import datetime, timedelta
 import uuid
 
 # Import internal modules
-from nlp_agent import NLPAgent
+from nlp_agent import NLPAgent, close_shared_session
 from wallet_core import WalletCore
 from config import settings
 
@@ -234,7 +234,8 @@ async def startup_event():
         logger.info("🚀 Initializing Sophisticated Senna Wallet Backend...")
         
         # Initialize Wallet Core with enhanced features
-        wallet_core = WalletCore()
+        wallet_core = WalletCore.instance()
+        await wallet_core.ensure_ready()
         logger.info("✅ Enhanced Wallet Core initialized")
         
         # Initialize Advanced NLP Agent (Groq only)
@@ -252,6 +253,17 @@ async def startup_event():
         logger.error(f"❌ Sophisticated startup failed: {str(e)}")
         raise
 
+# Shutdown event - release shared resources
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background work and close shared HTTP connections"""
+    if nlp_agent:
+        await nlp_agent.close()
+    if wallet_core:
+        await wallet_core.close()
+    await close_shared_session()
+    logger.info("👋 Senna Wallet Backend shut down")
+
 # Background tasks
 async def background_session_cleanup():
     """Clean up expired sessions periodically"""
@@ -320,6 +332,8 @@ async def root():
 @app.get("/health", tags=["Health"])
 async def health_check():
     """Comprehensive health check endpoint"""
+    # Shared short-lived network snapshot (one batched RPC) instead of blocking web3 calls
+    network_info = await wallet_core.get_network_info() if wallet_core else {}
     health_status = {
         "status": "healthy",
         "service": "Senna Wallet API v2.0",
@@ -328,8 +342,8 @@ async def health_check():
         "blockchain": {
             "network": "Somnia Testnet",
             "chain_id": settings.SOMNIA_CHAIN_ID,
-            "connected": wallet_core.w3.is_connected() if wallet_core else False,
-            "latest_block": wallet_core.w3.eth.block_number if wallet_core else 0
+            "connected": network_info.get("is_connected", False),
+            "latest_block": network_info.get("block_number", 0)
         },
         "ai_agent": {
             "status": "active" if nlp_agent else "inactive",
@@ -350,6 +364,13 @@ async def health_check():
     }
     return health_status
 
+@app.get("/api/help", tags=["AI Chat"])
+async def get_help():
+    """Static help guide, served from pre-encoded JSON"""
+    if nlp_agent is None:
+        raise HTTPException(status_code=503, detail="AI agent not initialized")
+    return Response(content=nlp_agent.help_json_bytes(), media_type="application/json")
+
 @app.post("/api/chat", response_model=ChatResponse, tags=["AI Chat"])
 async def chat_with_senna(request: ChatRequest, background_tasks: BackgroundTasks):
     """
@@ -417,11 +438,10 @@ async def _handle_confirmation(session: Dict, request: ChatRequest, session_id:
         if pending_action == "send_transaction":
             try:
                 # Execute transaction
-                tx_hash = wallet_core.send_transaction(
-                    pending_data["private_key"],
-                    pending_data["to_address"],
-                    wallet_core.ether_to_wei(pending_data["amount"])
-                )
+                result = await wallet_core.send_transaction(pending_data, pending_data.get("private_key"))
+                if not result.get("success"):
+                    raise Exception(result.get("error", "Unknown error"))
+                tx_hash = result["transaction_hash"]
                 
                 # Clear pending action
                 session_manager.update_session(session_id, {
@@ -429,18 +449,18 @@ async def _handle_confirmation(session: Dict, request: ChatRequest, session_id:
                     "pending_data": None
                 })
 
-                explorer_url = f"{settings.SOMNIA_EXPLORER_URL}/tx/{tx_hash.hex()}"
+                explorer_url = f"{settings.SOMNIA_EXPLORER_URL}/tx/{tx_hash}"
                 
                 return ChatResponse(
                     response=f"✅ Transaction confirmed and sent!\n\n"
-                           f"**Transaction Hash:** {tx_hash.hex()}\n"
+                           f"**Transaction Hash:** {tx_hash}\n"
                            f"**Amount:** {pending_data['amount']} {pending_data.get('symbol', 'STT')}\n"
                            f"**To:** {pending_data['to_address']}\n"
                            f"**Status:** ⏳ Pending\n\n"
                            f"🔍 [View on Explorer]({explorer_url})",
                     action="send_transaction",
                     transaction_data={
-                        "transaction_hash": tx_hash.hex(),
+                        "transaction_hash": tx_hash,
                         "amount": pending_data["amount"],
                         "to_address": pending_data["to_address"],
                         "explorer_url": explorer_url
@@ -499,7 +519,7 @@ async def _handle_option_selection(session: Dict, request: ChatRequest, session_
 async def create_wallet(request: WalletCreateRequest):
     """Create a new wallet with enhanced security"""
     try:
-        wallet_info = wallet_core.create_wallet()
+        wallet_info = await wallet_core.create_wallet_async()
         
         return WalletCreateResponse(
             address=wallet_info["address"],
@@ -561,19 +581,20 @@ async def send_transaction(request: TransactionRequest):
                 timestamp=datetime.now().isoformat()
             )
 
-        # Execute transaction
-        amount_wei = wallet_core.ether_to_wei(request.amount)
-        tx_hash = wallet_core.send_transaction(
-            request.private_key,
-            request.to_address,
-            amount_wei,
-            request.gas_limit
-        )
+        # Execute transaction; gas is estimated by the wallet core
+        result = await wallet_core.send_transaction({
+            "from_address": request.from_address,
+            "to_address": request.to_address,
+            "amount": request.amount
+        }, request.private_key)
+        if not result.get("success"):
+            raise Exception(result.get("error", "Unknown error"))
+        tx_hash = result["transaction_hash"]
         
-        explorer_url = f"{settings.SOMNIA_EXPLORER_URL}/tx/{tx_hash.hex()}"
+        explorer_url = f"{settings.SOMNIA_EXPLORER_URL}/tx/{tx_hash}"
         
         return TransactionResponse(
-            transaction_hash=tx_hash.hex(),
+            transaction_hash=tx_hash,
             from_address=request.from_address,
             to_address=request.to_address,
             amount=str(request.amount),
@@ -752,7 +773,7 @@ async def get_system_info():
     return {
         "version": "2.0.0",
         "status": "operational",
-        "blockchain": wallet_core.get_network_info(),
+        "blockchain": await wallet_core.get_network_info(),
         "ai_capabilities": {
             "multi_step_confirmations": True,
             "market_analysis": True,
@@ -1,100 +1,161 @@
 # backend/nlp_agent.py
 import os
-import json
 import logging
 import asyncio
+import copy
 import re
-from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import functools
+import time
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, Any, List, Optional, Tuple, AsyncIterator
 import aiohttp
-from datetime import datetime
+import orjson
+from datetime import datetime, timezone
 from decimal import Decimal, ROUND_DOWN
+from wallet_core import SingleFlight
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-class EnhancedNLPAgent:
-    """
-    Advanced AI Agent for processing natural language commands with enhanced features:
-    - Multi-AI provider support with fallback
-    - Smart confirmation flows
-    - Enhanced parameter extraction
-    - Explorer integration
-    - Market analysis capabilities
-    """
+# Cache sizes for repeated messages
+_INTENT_CACHE_SIZE = 2048
+_AI_CACHE_SIZE = 512
+
+# Lifetime of a cached AI response (seconds)
+_AI_CACHE_TTL = 300
+
+# Messages carrying addresses or amounts are never served from the AI cache
+_VOLATILE_MESSAGE_RE = re.compile(r'0x[a-fA-F0-9]|\d')
+
+# Filler words ignored when keying the AI cache, so paraphrases like
+# "what is the price of somi?" and "what's the price of SOMI" share an entry
+_CACHE_STOPWORDS = frozenset({
+    "a", "an", "the", "is", "are", "s", "of", "for", "to", "me", "my", "i",
+    "please", "pls", "can", "could", "you", "would", "now", "current", "currently",
+    "show", "tell", "check", "what", "whats", "how", "much", "hi", "hello", "hey",
+    "tolong", "dong", "ya", "saya", "aku", "berapa"
+})
+
+# Freshness of balance/market data used to build AI context (seconds)
+_MARKET_CONTEXT_TTL = 10
+_BALANCE_CONTEXT_TTL = 3
+_BALANCE_CACHE_SIZE = 1024
+
+# Freshness of token/gas prices served to the price and gas handlers (seconds)
+_PRICE_CACHE_TTL = 5
+_GAS_CACHE_TTL = 3
+_PRICE_CACHE_SIZE = 64
+
+# Minimum local pattern-matching confidence to trust it without the AI
+_LOCAL_INTENT_CONFIDENCE = 0.8
+
+# Intents that never need live balance/market data in their context
+_CONTEXT_FREE_INTENTS = frozenset({"help", "gas_price"})
+
+# Intents executed straight from local pattern matching, bypassing the AI
+_DIRECT_INTENTS = frozenset({"get_balance", "help", "gas_price"})
+
+# Send verbs: messages mentioning them always go through the AI
+_SEND_KEYWORD_RE = re.compile(r'\b(?:kirim|send|transfer|berikan|kasih|pay|forward)\b', re.IGNORECASE)
+
+# Recipient address, amount + symbol and "send all" markers in send requests,
+# tokenized in one pass. Matches may only start at the beginning of a
+# digit/hex run, so long runs cannot backtrack.
+_SEND_RE = re.compile(
+    r'(?P<address>(?<![0-9a-fA-F])0x[a-fA-F0-9]{40}(?![0-9a-fA-F]))'
+    r'|(?<![\d.])(?P<amount>\d+(?:\.\d+)?)\s*(?P<symbol>SOMI|STT|ETH|BTC)'
+    r'|\b(?P<send_all>all|everything)\b',
+    re.IGNORECASE
+)
+
+# Symbol keywords (and common names) mapped to their ticker
+_SYMBOL_MAP = MappingProxyType({
+    "SOMI": "SOMI", "STT": "STT",
+    "ETH": "ETH", "ETHER": "ETH", "ETHEREUM": "ETH",
+    "BTC": "BTC", "BITCOIN": "BTC"
+})
+_SYMBOL_RE = re.compile(r'\b(' + '|'.join(_SYMBOL_MAP) + r')\b', re.IGNORECASE)
+
+# Overall time budget when racing the configured AI providers (seconds)
+_AI_RACE_TIMEOUT = 10
+
+# JSON payloads longer than this are parsed off the event loop
+_AI_CONTENT_THREAD_THRESHOLD = 4096
+_AI_BODY_THREAD_THRESHOLD = 8192
+
+# Keyword patterns for local intent extraction (read-only, shared by all agents)
+_INTENT_PATTERNS = MappingProxyType({
+    "get_balance": (
+        "saldo", "balance", "cek saldo", "berapa saldo", "lihat saldo", 
+        "my balance", "check balance", "show balance", "what's my balance",
+        "how much do i have", "wallet balance"
+    ),
+    "send_transaction": (
+        "kirim", "send", "transfer", "berikan", "kasih", "to 0x", "to ",
+        "send to", "transfer to", "pay", "make payment", "forward"
+    ),
+    "receive": (
+        "terima", "receive", "dapat", "minta", "get", "receive funds",
+        "my address", "where to send", "deposit"
+    ),
+    "create_wallet": (
+        "buat wallet", "buat dompet", "wallet baru", "dompet baru", 
+        "create wallet", "new wallet", "generate wallet", "make wallet"
+    ),
+    "get_price": (
+        "harga", "price", "nilai", "berapa harga", "kurs", "current price", 
+        "what's the price", "price of", "how much is", "market price",
+        "value of", "crypto price"
+    ),
+    "buy_crypto": (
+        "beli", "buy", "pembelian", "purchase", "i want to buy", 
+        "get some", "acquire", "buy some", "purchase crypto"
+    ),
+    "compare_exchanges": (
+        "bandingkan", "compare", "mana yang", "terbaik", "best place",
+        "where to buy", "best exchange", "compare prices", "price comparison"
+    ),
+    "help": (
+        "bantuan", "help", "tolong", "cara pakai", "what can you do", 
+        "how to use", "commands", "features", "help me"
+    ),
+    "gas_price": (
+        "gas", "gas price", "fee", "transaction fee", "network fee",
+        "how much gas", "gas cost", "ethereum gas"
+    ),
+    "transaction_history": (
+        "history", "riwayat", "transaksi", "transaction history",
+        "my transactions", "recent transactions", "past transactions"
+    ),
+    "market_analysis": (
+        "analysis", "analisis", "market", "trend", "prediction",
+        "market analysis", "price prediction", "market trend"
+    )
+})
+
+# Keyword patterns split into single words (matched against the message's
+# tokens) and multi-word phrases (matched as substrings)
+_INTENT_WORDS = MappingProxyType({
+    intent: frozenset(word for word in words if ' ' not in word)
+    for intent, words in _INTENT_PATTERNS.items()
+})
+_INTENT_PHRASES = MappingProxyType({
+    intent: tuple(word for word in words if ' ' in word)
+    for intent, words in _INTENT_PATTERNS.items()
+})
+_TOKEN_RE = re.compile(r'\w+')
+
+# Word endings stripped to get a token's stem: English plural "s" and the
+# Indonesian particles/possessive ("saldonya", "berapakah", "kirimlah")
+_TOKEN_SUFFIXES = ("s", "nya", "kah", "lah")
+
+# Response templates with confirmation flows
+_RESPONSE_TEMPLATES = MappingProxyType({
+    "balance": "💰 **Your Wallet Balance**\n\n**Address:** `{address}`\n**Balance:** `{balance} {symbol}`\n**Network:** Somnia Testnet",
     
-    def __init__(self, wallet_core):
-        self.wallet_core = wallet_core
-        self.session = None
-        
-        # Enhanced AI Provider Configuration
-        self.ai_provider = os.getenv("AI_PROVIDER", "groq").lower()
-        self.groq_api_key = os.getenv("GROQ_API_KEY")
-        self.groq_base_url = "https://api.groq.com/openai/v1"
-        self.groq_model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
-        
-        self.deepseek_api_key = os.getenv("DEEPSEEK_API_KEY")
-        self.deepseek_base_url = "https://api.deepseek.com/v1"
-        self.deepseek_model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
-        
-        self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        self.openai_base_url = "https://api.openai.com/v1"
-        self.openai_model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-        
-        # Enhanced intent patterns with better matching
-        self.intent_patterns = {
-            "get_balance": [
-                "saldo", "balance", "cek saldo", "berapa saldo", "lihat saldo", 
-                "my balance", "check balance", "show balance", "what's my balance",
-                "how much do i have", "wallet balance"
-            ],
-            "send_transaction": [
-                "kirim", "send", "transfer", "berikan", "kasih", "to 0x", "to ",
-                "send to", "transfer to", "pay", "make payment", "forward"
-            ],
-            "receive": [
-                "terima", "receive", "dapat", "minta", "get", "receive funds",
-                "my address", "where to send", "deposit"
-            ],
-            "create_wallet": [
-                "buat wallet", "buat dompet", "wallet baru", "dompet baru", 
-                "create wallet", "new wallet", "generate wallet", "make wallet"
-            ],
-            "get_price": [
-                "harga", "price", "nilai", "berapa harga", "kurs", "current price", 
-                "what's the price", "price of", "how much is", "market price",
-                "value of", "crypto price"
-            ],
-            "buy_crypto": [
-                "beli", "buy", "pembelian", "purchase", "i want to buy", 
-                "get some", "acquire", "buy some", "purchase crypto"
-            ],
-            "compare_exchanges": [
-                "bandingkan", "compare", "mana yang", "terbaik", "best place",
-                "where to buy", "best exchange", "compare prices", "price comparison"
-            ],
-            "help": [
-                "bantuan", "help", "tolong", "cara pakai", "what can you do", 
-                "how to use", "commands", "features", "help me"
-            ],
-            "gas_price": [
-                "gas", "gas price", "fee", "transaction fee", "network fee",
-                "how much gas", "gas cost", "ethereum gas"
-            ],
-            "transaction_history": [
-                "history", "riwayat", "transaksi", "transaction history",
-                "my transactions", "recent transactions", "past transactions"
-            ],
-            "market_analysis": [
-                "analysis", "analisis", "market", "trend", "prediction",
-                "market analysis", "price prediction", "market trend"
-            ]
-        }
-        
-        # Enhanced response templates with confirmation flows
-        self.response_templates = {
-            "balance": "💰 **Your Wallet Balance**\n\n**Address:** `{address}`\n**Balance:** `{balance} {symbol}`\n**Network:** Somnia Testnet",
-            
-            "send_confirmation": """
+    "send_confirmation": """
 🔔 **Transaction Confirmation Required**
 
 I'm about to send:
@@ -105,8 +166,8 @@ I'm about to send:
 
 **Are you sure you want to proceed?** Please confirm this transaction.
 """,
-            
-            "send_success": """
+    
+    "send_success": """
 ✅ **Transaction Successful!**
 
 **Details:**
@@ -117,10 +178,10 @@ I'm about to send:
 
 Your new balance will be updated shortly.
 """,
-            
-            "send_failed": "❌ **Transaction Failed**\n\nError: `{error}`\n\nPlease check the details and try again.",
-            
-            "wallet_created": """
+    
+    "send_failed": "❌ **Transaction Failed**\n\nError: `{error}`\n\nPlease check the details and try again.",
+    
+    "wallet_created": """
 🎉 **New Wallet Created Successfully!**
 
 **Wallet Details:**
@@ -133,8 +194,8 @@ Your new balance will be updated shortly.
 - We cannot recover your wallet if you lose these
 - Never share your private key with anyone
 """,
-            
-            "price_info": """
+    
+    "price_info": """
 📊 **Market Data - {symbol}**
 
 **Current Price:**
@@ -147,8 +208,8 @@ Your new balance will be updated shortly.
 - 24h Volume: `${volume_24h}`
 - All-Time High: `${ath}`
 """,
-            
-            "help": """
+    
+    "help": """
 🤖 **Senna Wallet AI Assistant - Help Guide**
 
 **💼 Wallet Management**
@@ -178,53 +239,356 @@ Your new balance will be updated shortly.
 - Verify transactions on the explorer
 - Keep your private keys secure!
 """
+})
+
+# Suggested follow-up actions, shared by every response of a kind
+_BALANCE_ACTIONS = ("send_transaction", "check_price", "view_transactions")
+_SEND_CONFIRM_ACTIONS = ("confirm_transaction", "cancel_transaction", "edit_amount")
+_SEND_SUCCESS_ACTIONS = ("view_on_explorer", "check_balance", "new_transaction")
+_WALLET_CREATED_ACTIONS = ("backup_wallet", "check_balance", "send_transaction")
+_PRICE_ACTIONS = ("buy_crypto", "compare_exchanges", "market_analysis")
+_GAS_ACTIONS = ("send_transaction", "check_balance", "get_price")
+_HELP_ACTIONS = ("get_balance", "get_price", "send_transaction", "create_wallet")
+_FALLBACK_ACTIONS = ("check_balance", "get_price", "send_transaction", "view_help")
+_CONNECT_WALLET_ACTIONS = ("create_wallet", "connect_wallet")
+_ERROR_ACTIONS = ("retry", "help", "contact_support")
+
+# Prebuilt responses for expected failures; nested values are immutable so a
+# shallow copy per response is safe
+_ERROR_TEMPLATES = MappingProxyType({
+    "wallet_required": {
+        "response": "Please connect your wallet or create a new one to check your balance.",
+        "success": False,
+        "action": "get_balance",
+        "suggested_actions": _CONNECT_WALLET_ACTIONS
+    },
+    "send_details_required": {
+        "response": "To send a transaction, I need both the amount and recipient address. Please provide details like: 'Send 10 STT to 0x1a2b3c4d...'",
+        "success": False,
+        "action": "send_transaction",
+        "requires_confirmation": False
+    },
+    "processing_failed": {
+        "response": "❌ **I encountered an error**\n\nSomething went wrong while processing your message.\n\nPlease try again or contact support if the issue persists.",
+        "success": False,
+        "action": "error",
+        "requires_confirmation": False,
+        "suggested_actions": _ERROR_ACTIONS
+    }
+})
+
+# Constant parts of the help and generic error responses
+_HELP_RESPONSE = MappingProxyType({
+    "response": _RESPONSE_TEMPLATES["help"],
+    "success": True,
+    "action": "help",
+    "requires_confirmation": False,
+    "suggested_actions": _HELP_ACTIONS
+})
+_ERROR_SKELETON = MappingProxyType({
+    "success": False,
+    "action": "error",
+    "requires_confirmation": False,
+    "suggested_actions": _ERROR_ACTIONS
+})
+
+# Parameter extraction patterns
+_PARAMETER_PATTERNS = MappingProxyType({
+    "amount": (
+        r'(\d+\.?\d*)\s*(SOMI|STT|ETH|BTC|USD|IDR|RP|\\$|₨)',
+        r'(\d+\.?\d*)\s*(token|coin|crypto)',
+        r'send\s+(\d+\.?\d*)',
+        r'transfer\s+(\d+\.?\d*)'
+    ),
+    "address": (
+        r'0x[a-fA-F0-9]{40}',
+        r'[a-zA-Z0-9]{34}',  # For other blockchain addresses
+        r'to\s+(\S+)'
+    ),
+    "currency": (
+        r'\$(\\d+\\.?\\d*)',
+        r'₨(\\d+\\.?\\d*)',
+        r'(\\d+\\.?\\d*)\s*(USD|IDR|RP)',
+        r'(\\d+\\.?\\d*)\s*(dollar|rupiah)'
+    )
+})
+
+# Static part of the AI system prompt; the context tail is appended per call
+_BASE_SYSTEM_PROMPT = """You are Senna, an advanced AI wallet assistant for Somnia blockchain. 
+Parse user messages and return structured JSON with intent, parameters, and enhanced features.
+
+Available enhanced actions:
+- get_balance: Get wallet balance with enhanced display
+- send_transaction: Send crypto with confirmation flow
+- create_wallet: Create new wallet with security warnings
+- get_price: Get token price with market analysis
+- convert_currency: Convert between fiat and crypto
+- buy_crypto: Initiate crypto purchase
+- compare_exchanges: Compare exchange prices with recommendations
+- gas_price: Get current network gas prices
+- transaction_history: Get transaction history
+- market_analysis: Provide market insights
+- help: Show enhanced help guide
+
+Enhanced Response Format:
+{
+    "intent": "action_name",
+    "parameters": {"key": "value"},
+    "confidence": 0.9,
+    "response_message": "Enhanced friendly response with formatting",
+    "requires_confirmation": false,
+    "explorer_links": [],
+    "suggested_actions": [],
+    "market_insights": {}
+}
+
+Special Features:
+- Always include explorer links for transactions
+- Add confirmation flows for sensitive actions
+- Provide market insights when relevant
+- Suggest next actions for better UX
+"""
+
+# Compact system prompts for messages the local matcher already classified;
+# keyed by intent class, used instead of the full prompt above
+_MINI_SYSTEM_PROMPTS = MappingProxyType({
+    "send_transaction": """You are Senna, a Somnia wallet assistant. Extract the transfer from the user message.
+Return only JSON: {"intent": "send_transaction", "parameters": {"amount": number, "symbol": "SOMI|STT|ETH|BTC", "to_address": "0x..."}, "confidence": 0-1, "response_message": "short reply", "requires_confirmation": true}
+If the message is not a transfer, return {"intent": "help", "parameters": {}, "confidence": 0.5, "response_message": "short reply"}.""",
+    
+    "get_price": """You are Senna, a Somnia wallet assistant. Extract the token price request from the user message.
+Return only JSON: {"intent": "get_price", "parameters": {"symbol": "SOMI|STT|ETH|BTC"}, "confidence": 0-1, "response_message": "short reply", "requires_confirmation": false}
+If the message is not a price request, return {"intent": "help", "parameters": {}, "confidence": 0.5, "response_message": "short reply"}."""
+})
+
+# Shannon explorer URLs, joined by concatenation instead of per-call f-strings
+_EXPLORER_BASE = "https://shannon-explorer.somnia.network/"
+_EXPLORER_TX_PREFIX = _EXPLORER_BASE + "tx/"
+_EXPLORER_ADDRESS_PREFIX = _EXPLORER_BASE + "address/"
+_EXPLORER_LINKS_BASE = (_EXPLORER_BASE,)
+
+# Constant fields of the price, gas and send responses; handlers copy a
+# prototype and fill in the per-call fields
+_PRICE_RESPONSE_PROTO = MappingProxyType({
+    "success": True,
+    "action": "get_price",
+    "explorer_links": _EXPLORER_LINKS_BASE,
+    "suggested_actions": _PRICE_ACTIONS
+})
+_GAS_RESPONSE_PROTO = MappingProxyType({
+    "success": True,
+    "action": "gas_price",
+    "requires_confirmation": False,
+    "suggested_actions": _GAS_ACTIONS
+})
+_SEND_CONFIRM_PROTO = MappingProxyType({
+    "success": True,
+    "action": "send_transaction",
+    "requires_confirmation": True,
+    "suggested_actions": _SEND_CONFIRM_ACTIONS
+})
+_SEND_SUCCESS_PROTO = MappingProxyType({
+    "success": True,
+    "action": "send_transaction",
+    "requires_confirmation": False,
+    "suggested_actions": _SEND_SUCCESS_ACTIONS
+})
+_SEND_FAILED_PROTO = MappingProxyType({
+    "success": False,
+    "action": "send_transaction",
+    "requires_confirmation": False
+})
+
+# Intents whose handlers need token/gas prices; fetched while the AI runs
+_MARKET_INTENTS = frozenset({"get_price", "gas_price"})
+
+# Minimum local confidence to use a compact prompt instead of the full one
+_MINI_PROMPT_CONFIDENCE = 0.7
+
+# Context timestamp, reformatted at most once per second: (monotonic second, ISO string)
+_CONTEXT_TIMESTAMP: Tuple[Optional[int], str] = (None, "")
+
+
+def _context_timestamp() -> str:
+    """Get a second-resolution UTC timestamp for AI context"""
+    global _CONTEXT_TIMESTAMP
+    second = int(time.monotonic())
+    if _CONTEXT_TIMESTAMP[0] != second:
+        _CONTEXT_TIMESTAMP = (second, datetime.now(timezone.utc).isoformat(timespec="seconds"))
+    return _CONTEXT_TIMESTAMP[1]
+
+
+# Process-wide HTTP session shared by all agent instances
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it with a pooled connector on first use"""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            enable_cleanup_closed=True
+        )
+        _SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=30, connect=5)
+        )
+    return _SESSION
+
+
+async def close_shared_session():
+    """Close the shared aiohttp session on application shutdown"""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+class EnhancedNLPAgent:
+    """
+    Advanced AI Agent for processing natural language commands with enhanced features:
+    - Multi-AI provider support with fallback
+    - Smart confirmation flows
+    - Enhanced parameter extraction
+    - Explorer integration
+    - Market analysis capabilities
+    """
+    
+    def __init__(self, wallet_core):
+        self.wallet_core = wallet_core
+        self.session = None
+        
+        # Enhanced AI Provider Configuration
+        self.ai_provider = os.getenv("AI_PROVIDER", "groq").lower()
+        self.groq_api_key = os.getenv("GROQ_API_KEY")
+        self.groq_base_url = "https://api.groq.com/openai/v1"
+        self.groq_model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
+        
+        self.deepseek_api_key = os.getenv("DEEPSEEK_API_KEY")
+        self.deepseek_base_url = "https://api.deepseek.com/v1"
+        self.deepseek_model = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+        
+        self.openai_api_key = os.getenv("OPENAI_API_KEY")
+        self.openai_base_url = "https://api.openai.com/v1"
+        self.openai_model = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+        
+        # Per-provider request URLs and headers, built once
+        self._groq_url = f"{self.groq_base_url}/chat/completions"
+        self._groq_headers = self._build_ai_headers(self.groq_api_key)
+        self._deepseek_url = f"{self.deepseek_base_url}/chat/completions"
+        self._deepseek_headers = self._build_ai_headers(self.deepseek_api_key)
+        self._openai_url = f"{self.openai_base_url}/chat/completions"
+        self._openai_headers = self._build_ai_headers(self.openai_api_key)
+        
+        # Optionally stream chat completions (SSE); the JSON reply is only
+        # parsed once complete, so streaming is off by default
+        self.ai_streaming = os.getenv("AI_STREAMING", "false").lower() == "true"
+        
+        # Constant part of each provider's request body; only messages vary per call
+        self._groq_payload_base = self._build_ai_payload_base(self.groq_model)
+        self._deepseek_payload_base = self._build_ai_payload_base(self.deepseek_model)
+        self._openai_payload_base = self._build_ai_payload_base(self.openai_model)
+        
+        # Enhanced intent patterns with better matching
+        self.intent_patterns = _INTENT_PATTERNS
+        self._intent_words = _INTENT_WORDS
+        self._intent_phrases = _INTENT_PHRASES
+        
+        # Enhanced response templates with confirmation flows
+        self.response_templates = _RESPONSE_TEMPLATES
+        # Bound formatters, one per template, each taking a dict of fields
+        self._tmpl = {name: template.format_map for name, template in self.response_templates.items()}
+        
+        # Error message formatter, bound once for failure bursts
+        self._err_fmt = "❌ **I encountered an error**\n\n`{}`\n\nPlease try again or contact support if the issue persists.".format
+        
+        # Help guide pre-encoded once; it never changes at runtime
+        self._help_json = orjson.dumps(dict(_HELP_RESPONSE))
+        
+        # Intent -> handler taking (parameters, wallet_address, context). Async
+        # handlers return a coroutine, I/O-free ones (help) their response
+        self._action_dispatch = {
+            "get_balance": lambda parameters, wallet_address, context: self._handle_enhanced_get_balance(wallet_address, context),
+            "send_transaction": self._handle_enhanced_send_transaction,
+            "create_wallet": lambda parameters, wallet_address, context: self._handle_enhanced_create_wallet(context),
+            "get_price": lambda parameters, wallet_address, context: self._handle_enhanced_get_price(parameters, context),
+            "gas_price": lambda parameters, wallet_address, context: self._handle_enhanced_gas_price(context),
+            "help": lambda parameters, wallet_address, context: self._handle_enhanced_help(context)
         }
         
         # Enhanced parameter extraction patterns
-        self.parameter_patterns = {
-            "amount": [
-                r'(\d+\.?\d*)\s*(SOMI|STT|ETH|BTC|USD|IDR|RP|\\$|₨)',
-                r'(\d+\.?\d*)\s*(token|coin|crypto)',
-                r'send\s+(\d+\.?\d*)',
-                r'transfer\s+(\d+\.?\d*)'
-            ],
-            "address": [
-                r'0x[a-fA-F0-9]{40}',
-                r'[a-zA-Z0-9]{34}',  # For other blockchain addresses
-                r'to\s+(\S+)'
-            ],
-            "currency": [
-                r'\$(\\d+\\.?\\d*)',
-                r'₨(\\d+\\.?\\d*)',
-                r'(\\d+\\.?\\d*)\s*(USD|IDR|RP)',
-                r'(\\d+\\.?\\d*)\s*(dollar|rupiah)'
-            ]
-        }
+        self.parameter_patterns = _PARAMETER_PATTERNS
+        
+        # Caches for repeated messages: local intent extraction and parsed AI responses
+        self._cached_intent_extraction = functools.lru_cache(maxsize=_INTENT_CACHE_SIZE)(
+            self._extract_intent
+        )
+        self._ai_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        
+        # Context data refreshed in the background instead of per message
+        self._market_cache = {"data": None, "ts": 0}
+        self._balance_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._market_refresh_task = None
+        
+        # Short-lived token/gas price cache, bounded LRU (symbols come from the
+        # AI); concurrent misses for a key all await the same in-flight fetch
+        self._price_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._price_fetches = SingleFlight()
         
         logger.info(f"🧠 Enhanced NLP Agent initialized with provider: {self.ai_provider}")
     
     async def initialize(self):
-        """Initialize async session"""
-        self.session = aiohttp.ClientSession()
+        """Initialize shared async session and background market refresh"""
+        self.session = await get_shared_session()
+        if self._market_refresh_task is None:
+            self._market_refresh_task = asyncio.create_task(self._refresh_market_loop())
         logger.info("✅ Enhanced NLP Agent session initialized")
     
     async def close(self):
-        """Close async session"""
-        if self.session:
-            await self.session.close()
+        """Stop background market refresh; the shared session is closed on shutdown"""
+        if self._market_refresh_task:
+            self._market_refresh_task.cancel()
+            self._market_refresh_task = None
     
     async def process_message(self, message: str, wallet_address: str = None, session_id: str = None) -> Dict[str, Any]:
         """
         Enhanced message processing with advanced features
         """
+        market_prefetch = None
         try:
-            logger.info(f"🧠 Processing message: {message}")
+            logger.info("🧠 Processing message: %s", message)
             
-            # Enhanced context building
-            context = await self._build_context(wallet_address, session_id)
+            # Static context only; live data is fetched when the AI needs it
+            local_intent = self._enhanced_intent_extraction(message)
+            is_confident = local_intent["confidence"] >= _LOCAL_INTENT_CONFIDENCE
+            context = self._build_base_context(wallet_address, session_id)
             
-            # Try AI provider first
-            ai_response = await self._call_ai_api(message, wallet_address, context)
+            if is_confident and self._is_direct_intent(message, local_intent):
+                # Trivially classifiable message, no AI round-trip needed
+                ai_response = local_intent
+            else:
+                # Try AI provider first, reusing the parsed response for repeated messages
+                ai_response = self._get_cached_ai_response(message)
+                if ai_response is None:
+                    if local_intent["intent"] in _MARKET_INTENTS:
+                        # Speculatively fetch price and gas data while the AI call runs
+                        symbol = local_intent["parameters"].get("symbol", "SOMI")
+                        market_prefetch = asyncio.create_task(self._prefetch_market(symbol))
+                        context["_market_prefetch"] = market_prefetch
+                    # Live data is only useful when an AI provider will read it;
+                    # skip it for wallet-independent intents too
+                    if (self._get_configured_provider_calls()
+                            and not (is_confident and local_intent["intent"] in _CONTEXT_FREE_INTENTS)):
+                        await self._fetch_live_context(context, wallet_address)
+                    if (local_intent["confidence"] >= _MINI_PROMPT_CONFIDENCE
+                            and local_intent["intent"] in _MINI_SYSTEM_PROMPTS):
+                        # Already classified locally: only parameters are needed from the AI
+                        context["intent_class"] = local_intent["intent"]
+                    ai_response = await self._call_ai_api(message, wallet_address, context)
+                    self._store_cached_ai_response(message, ai_response)
             
             if ai_response and ai_response.get("success", True):
                 response = await self._execute_enhanced_action(ai_response, wallet_address, context)
@@ -235,76 +599,228 @@ Your new balance will be updated shortly.
             # Add session and context data
             response.update({
                 "session_id": session_id,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "requires_confirmation": response.get("requires_confirmation", False),
                 "explorer_links": response.get("explorer_links", [])
             })
             
             return response
             
-        except Exception as e:
-            logger.error(f"❌ Enhanced NLP processing error: {str(e)}")
-            return self._create_error_response(str(e))
+        except Exception:
+            # Unexpected failure: details go to the log, the user gets a prebuilt response
+            logger.exception("❌ Enhanced NLP processing error")
+            return dict(_ERROR_TEMPLATES["processing_failed"])
+        finally:
+            # The AI may have picked an intent that didn't use the prefetched data
+            if market_prefetch is not None:
+                market_prefetch.cancel()
+    
+    def _is_direct_intent(self, message: str, local_intent: Dict[str, Any]) -> bool:
+        """Check whether a message can skip the AI: a direct intent with no free-form parameters"""
+        if local_intent["intent"] not in _DIRECT_INTENTS:
+            return False
+        # Amounts, addresses or send verbs ("send my whole balance to 0x...")
+        # need the AI even when a keyword like "balance" matched first
+        return not (_VOLATILE_MESSAGE_RE.search(message) or _SEND_KEYWORD_RE.search(message))
     
-    async def _build_context(self, wallet_address: str = None, session_id: str = None) -> Dict[str, Any]:
-        """Build enhanced context for AI processing"""
+    def _ai_cache_key(self, message: str) -> Optional[str]:
+        """Get AI cache key for a message, or None when it must not be cached"""
+        normalized = message.strip().lower()
+        if _VOLATILE_MESSAGE_RE.search(normalized):
+            return None
+        # Content words in order: punctuation, case and filler words don't matter
+        words = [word for word in _TOKEN_RE.findall(normalized) if word not in _CACHE_STOPWORDS]
+        if words:
+            normalized = " ".join(words)
+        return hashlib.blake2b(normalized.encode()).hexdigest()
+    
+    def _get_cached_ai_response(self, message: str) -> Optional[Dict[str, Any]]:
+        """Get cached AI response for a previously seen message"""
+        key = self._ai_cache_key(message)
+        if key is None or key not in self._ai_cache:
+            return None
+        cached_at, ai_response = self._ai_cache[key]
+        if time.monotonic() - cached_at >= _AI_CACHE_TTL:
+            del self._ai_cache[key]
+            return None
+        self._ai_cache.move_to_end(key)
+        # Deep copy: handlers may mutate nested parameters
+        return copy.deepcopy(ai_response)
+    
+    def _store_cached_ai_response(self, message: str, ai_response: Optional[Dict[str, Any]]):
+        """Cache a successful AI provider response with TTL and LRU eviction"""
+        if not ai_response or not ai_response.get("success", True):
+            return
+        if ai_response.get("requires_confirmation"):
+            return
+        key = self._ai_cache_key(message)
+        if key is None:
+            return
+        self._ai_cache[key] = (time.monotonic(), copy.deepcopy(ai_response))
+        self._ai_cache.move_to_end(key)
+        if len(self._ai_cache) > _AI_CACHE_SIZE:
+            self._ai_cache.popitem(last=False)
+    
+    def _build_base_context(self, wallet_address: str = None, session_id: str = None) -> Dict[str, Any]:
+        """Build static context for AI processing (no I/O)"""
         context = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _context_timestamp(),
             "network": "Somnia Testnet",
             "chain_id": 50312,
-            "explorer_url": "https://shannon-explorer.somnia.network/"
+            "explorer_url": _EXPLORER_BASE
         }
         
         if wallet_address:
             context["wallet_address"] = wallet_address
-            try:
-                # Get current balance for context
-                balance_wei = self.wallet_core.get_balance(wallet_address)
-                balance_ether = self.wallet_core.wei_to_ether(balance_wei)
-                context["current_balance"] = f"{balance_ether} STT"
-            except Exception as e:
-                logger.warning(f"Could not fetch balance for context: {e}")
         
-        # Add market context
+        return context
+    
+    async def _fetch_live_context(self, context: Dict[str, Any], wallet_address: str = None):
+        """Add balance and market data to the context concurrently"""
+        fetchers = [self._fetch_market_context(context)]
+        if wallet_address:
+            fetchers.append(self._fetch_balance_context(context, wallet_address))
+        await asyncio.gather(*fetchers)
+    
+    async def _fetch_balance_context(self, context: Dict[str, Any], wallet_address: str):
+        """Add current wallet balance to the context"""
+        try:
+            context["current_balance"] = await self._get_context_balance(wallet_address)
+        except Exception as e:
+            logger.warning("Could not fetch balance for context: %s", e)
+    
+    async def _fetch_market_context(self, context: Dict[str, Any]):
+        """Add cached market data to the context"""
         try:
-            market_data = await self.wallet_core.get_market_data()
-            context["market_data"] = market_data
+            # The background loop keeps data fresh; only refresh inline when
+            # it is not running or has not produced data yet
+            is_stale = time.monotonic() - self._market_cache["ts"] >= _MARKET_CONTEXT_TTL
+            if self._market_cache["data"] is None or (is_stale and self._market_refresh_task is None):
+                await self._refresh_market_context()
+            context["market_data"] = self._market_cache["data"]
         except Exception as e:
-            logger.warning(f"Could not fetch market data for context: {e}")
+            logger.warning("Could not fetch market data for context: %s", e)
+    
+    async def _get_context_balance(self, wallet_address: str) -> str:
+        """Get formatted wallet balance for context, cached for a few seconds"""
+        cached = self._balance_cache.get(wallet_address)
+        now = time.monotonic()
+        if cached and now - cached[0] < _BALANCE_CONTEXT_TTL:
+            self._balance_cache.move_to_end(wallet_address)
+            return cached[1]
         
-        return context
+        # Blocking web3 call: run it off the event loop so the market fetch overlaps
+        balance_wei = await asyncio.to_thread(self.wallet_core.get_balance, wallet_address)
+        balance_ether = self.wallet_core.wei_to_ether(balance_wei)
+        current_balance = f"{balance_ether} STT"
+        self._balance_cache[wallet_address] = (now, current_balance)
+        self._balance_cache.move_to_end(wallet_address)
+        if len(self._balance_cache) > _BALANCE_CACHE_SIZE:
+            self._balance_cache.popitem(last=False)
+        return current_balance
+    
+    async def _refresh_market_context(self):
+        """Refresh cached market data used for context"""
+        market_data = await self.wallet_core.get_market_data()
+        self._market_cache = {"data": market_data, "ts": time.monotonic()}
+    
+    async def _refresh_market_loop(self):
+        """Keep cached market data fresh in the background"""
+        while True:
+            try:
+                await self._refresh_market_context()
+            except Exception as e:
+                logger.warning("Background market refresh failed: %s", e)
+            # Refresh at twice the TTL rate so readers never see expired data
+            await asyncio.sleep(_MARKET_CONTEXT_TTL / 2)
     
     async def _call_ai_api(self, message: str, wallet_address: str = None, context: Dict = None) -> Optional[Dict[str, Any]]:
-        """Enhanced AI API calls with better error handling and context"""
+        """Race all configured AI providers and return the first successful response"""
+        provider_calls = self._get_configured_provider_calls()
+        if not provider_calls:
+            logger.warning("No valid AI provider configured, using enhanced fallback")
+            return None
+        
+        tasks = [asyncio.create_task(call(message, wallet_address, context)) for call in provider_calls]
         try:
-            if self.ai_provider == "groq" and self.groq_api_key and self.groq_api_key != "your_groq_api_key_here":
-                return await self._call_enhanced_groq_api(message, wallet_address, context)
-            elif self.ai_provider == "deepseek" and self.deepseek_api_key and self.deepseek_api_key != "your_deepseek_api_key_here":
-                return await self._call_enhanced_deepseek_api(message, wallet_address, context)
-            elif self.ai_provider == "openai" and self.openai_api_key and self.openai_api_key != "your_openai_api_key_here":
-                return await self._call_enhanced_openai_api(message, wallet_address, context)
-            else:
-                logger.warning("No valid AI provider configured, using enhanced fallback")
-                return None
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _AI_RACE_TIMEOUT
+            pending = set(tasks)
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and task.result() is not None:
+                        return task.result()
+            logger.warning("No AI provider returned a usable response, using enhanced fallback")
+            return None
         except Exception as e:
-            logger.error(f"Enhanced AI API call failed: {str(e)}")
+            logger.error("Enhanced AI API call failed: %s", e)
             return None
+        finally:
+            # Cancel the providers that lost the race
+            for task in tasks:
+                task.cancel()
+    
+    def _get_configured_provider_calls(self) -> List:
+        """Get API call coroutines for every configured provider, preferred provider first"""
+        providers = [
+            ("groq", self.groq_api_key, "your_groq_api_key_here", self._call_enhanced_groq_api),
+            ("deepseek", self.deepseek_api_key, "your_deepseek_api_key_here", self._call_enhanced_deepseek_api),
+            ("openai", self.openai_api_key, "your_openai_api_key_here", self._call_enhanced_openai_api),
+        ]
+        providers.sort(key=lambda provider: provider[0] != self.ai_provider)
+        return [call for _, api_key, placeholder, call in providers if api_key and api_key != placeholder]
     
     async def _call_enhanced_groq_api(self, message: str, wallet_address: str = None, context: Dict = None) -> Optional[Dict[str, Any]]:
         """Enhanced Groq API call with better context and response handling"""
+        return await self._call_chat_completion_api(
+            "Groq", self._groq_url, self._groq_headers, self._groq_payload_base, message, wallet_address, context
+        )
+    
+    async def _call_enhanced_deepseek_api(self, message: str, wallet_address: str = None, context: Dict = None) -> Optional[Dict[str, Any]]:
+        """Enhanced DeepSeek API call (OpenAI-compatible endpoint)"""
+        return await self._call_chat_completion_api(
+            "DeepSeek", self._deepseek_url, self._deepseek_headers, self._deepseek_payload_base, message, wallet_address, context
+        )
+    
+    async def _call_enhanced_openai_api(self, message: str, wallet_address: str = None, context: Dict = None) -> Optional[Dict[str, Any]]:
+        """Enhanced OpenAI API call"""
+        return await self._call_chat_completion_api(
+            "OpenAI", self._openai_url, self._openai_headers, self._openai_payload_base, message, wallet_address, context
+        )
+    
+    def _build_ai_headers(self, api_key: str) -> Dict[str, str]:
+        """Build request headers for an OpenAI-compatible provider"""
+        return {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        }
+    
+    def _build_ai_payload_base(self, model: str) -> Dict[str, Any]:
+        """Build the constant chat completion request fields for a model"""
+        return {
+            "model": model,
+            "temperature": 0.1,
+            "max_tokens": 800,
+            "top_p": 0.9,
+            "response_format": {"type": "json_object"},
+            "stream": self.ai_streaming
+        }
+    
+    async def _call_chat_completion_api(self, provider: str, url: str, headers: Dict[str, str], payload_base: Dict[str, Any],
+                                        message: str, wallet_address: str = None, context: Dict = None) -> Optional[Dict[str, Any]]:
+        """Call an OpenAI-compatible chat completions endpoint and parse the JSON reply"""
         if not self.session:
             await self.initialize()
         
         try:
             prompt = self._build_enhanced_ai_prompt(message, wallet_address, context)
             
-            headers = {
-                "Authorization": f"Bearer {self.groq_api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
-                "model": self.groq_model,
+                **payload_base,
                 "messages": [
                     {
                         "role": "system",
@@ -314,73 +830,61 @@ Your new balance will be updated shortly.
                         "role": "user",
                         "content": prompt
                     }
-                ],
-                "temperature": 0.1,
-                "max_tokens": 800,
-                "top_p": 0.9,
-                "response_format": {"type": "json_object"}
+                ]
             }
             
             async with self.session.post(
-                f"{self.groq_base_url}/chat/completions", 
+                url, 
                 headers=headers, 
-                json=payload,
-                timeout=aiohttp.ClientTimeout(total=30)
+                data=orjson.dumps(payload)
             ) as response:
                 
                 if response.status == 200:
-                    data = await response.json()
-                    ai_content = data["choices"][0]["message"]["content"]
+                    if self.ai_streaming:
+                        ai_content = "".join([delta async for delta in self._iter_completion_deltas(response)])
+                    else:
+                        data = await self._load_json(await response.read(), _AI_BODY_THREAD_THRESHOLD)
+                        ai_content = data["choices"][0]["message"]["content"]
                     
-                    return self._parse_enhanced_ai_response(ai_content, message, context)
+                    return await self._parse_enhanced_ai_response(ai_content, message, context)
                 else:
                     error_text = await response.text()
-                    logger.error(f"Groq API error: {response.status} - {error_text}")
+                    logger.error("%s API error: %s - %s", provider, response.status, error_text)
                     return None
                     
         except asyncio.TimeoutError:
-            logger.error("Groq API timeout")
+            logger.error("%s API timeout", provider)
             return None
         except Exception as e:
-            logger.error(f"Enhanced Groq API call failed: {str(e)}")
+            logger.error("Enhanced %s API call failed: %s", provider, e)
             return None
     
+    async def _iter_completion_deltas(self, response) -> AsyncIterator[str]:
+        """Yield content deltas from a streamed (SSE) chat completion as they arrive"""
+        async for raw_line in response.content:
+            line = raw_line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            
+            data = line[5:].strip()
+            if data == b"[DONE]":
+                break
+            
+            chunk = orjson.loads(data)
+            if chunk.get("error"):
+                # Providers report mid-stream failures as an error frame
+                raise ValueError(f"stream error: {chunk['error']}")
+            
+            choices = chunk.get("choices")
+            if not choices:
+                continue
+            delta = choices[0].get("delta", {}).get("content")
+            if delta:
+                yield delta
+    
     def _get_enhanced_system_prompt(self, context: Dict = None) -> str:
-        """Get enhanced system prompt for AI"""
-        base_prompt = """You are Senna, an advanced AI wallet assistant for Somnia blockchain. 
-        Parse user messages and return structured JSON with intent, parameters, and enhanced features.
-
-        Available enhanced actions:
-        - get_balance: Get wallet balance with enhanced display
-        - send_transaction: Send crypto with confirmation flow
-        - create_wallet: Create new wallet with security warnings
-        - get_price: Get token price with market analysis
-        - convert_currency: Convert between fiat and crypto
-        - buy_crypto: Initiate crypto purchase
-        - compare_exchanges: Compare exchange prices with recommendations
-        - gas_price: Get current network gas prices
-        - transaction_history: Get transaction history
-        - market_analysis: Provide market insights
-        - help: Show enhanced help guide
-
-        Enhanced Response Format:
-        {
-            "intent": "action_name",
-            "parameters": {"key": "value"},
-            "confidence": 0.9,
-            "response_message": "Enhanced friendly response with formatting",
-            "requires_confirmation": false,
-            "explorer_links": [],
-            "suggested_actions": [],
-            "market_insights": {}
-        }
-
-        Special Features:
-        - Always include explorer links for transactions
-        - Add confirmation flows for sensitive actions
-        - Provide market insights when relevant
-        - Suggest next actions for better UX
-        """
+        """Get enhanced system prompt for AI, compact when the intent class is known"""
+        base_prompt = _MINI_SYSTEM_PROMPTS.get(context.get("intent_class"), _BASE_SYSTEM_PROMPT) if context else _BASE_SYSTEM_PROMPT
         
         if context:
             base_prompt += f"\n\nCurrent Context:\nNetwork: {context.get('network')}\n"
@@ -398,9 +902,13 @@ Your new balance will be updated shortly.
         if context:
             prompt += "Context Information:\n"
             for key, value in context.items():
-                if key != 'market_data':  # Don't include full market data in prompt
+                if key not in ('market_data', 'intent_class') and not key.startswith('_'):  # Don't include full market data in prompt
                     prompt += f"- {key}: {value}\n"
         
+        if context and context.get('intent_class') in _MINI_SYSTEM_PROMPTS:
+            # The compact system prompt already states what to extract
+            return prompt
+        
         prompt += """
         Analyze this message and extract:
         - Primary intent and action required
@@ -415,10 +923,19 @@ Your new balance will be updated shortly.
         
         return prompt
     
-    def _parse_enhanced_ai_response(self, ai_content: str, original_message: str, context: Dict = None) -> Dict[str, Any]:
-        """Parse enhanced AI response with better error handling"""
+    async def _load_json(self, raw, threshold: int) -> Any:
+        """Parse JSON, in a worker thread when the payload is large enough to stall the event loop"""
+        if len(raw) > threshold:
+            return await asyncio.to_thread(orjson.loads, raw)
+        return orjson.loads(raw)
+    
+    async def _parse_enhanced_ai_response(self, ai_content: str, original_message: str, context: Dict = None) -> Optional[Dict[str, Any]]:
+        """Parse enhanced AI response; None when the reply is unusable"""
         try:
-            response_data = json.loads(ai_content)
+            response_data = await self._load_json(ai_content, _AI_CONTENT_THREAD_THRESHOLD)
+            if not isinstance(response_data, dict):
+                logger.warning("AI response was not a JSON object, discarding it")
+                return None
             
             # Validate required fields
             if not response_data.get("intent"):
@@ -433,16 +950,32 @@ Your new balance will be updated shortly.
             
             return response_data
             
-        except json.JSONDecodeError:
-            logger.warning("AI response was not valid JSON, using enhanced pattern matching")
-            return self._enhanced_intent_extraction(original_message, context)
+        except orjson.JSONDecodeError:
+            # Not an AI result: let another provider win the race, or
+            # process_message fall back to local pattern matching
+            logger.warning("AI response was not valid JSON, discarding it")
+            return None
     
     def _enhanced_intent_extraction(self, message: str, context: Dict = None) -> Dict[str, Any]:
-        """Enhanced intent extraction with better parameter parsing"""
+        """Enhanced intent extraction, cached on the normalized message"""
+        # Only strip: address case is kept for display in confirmations
+        return copy.deepcopy(self._cached_intent_extraction(message.strip()))
+    
+    def _extract_intent(self, message: str) -> Dict[str, Any]:
+        """Pure intent extraction with better parameter parsing"""
         message_lower = message.lower()
         
+        # Tokenize once for all intents; stems let "balances" match "balance"
+        # and "saldonya" match "saldo"
+        words = _TOKEN_RE.findall(message_lower)
+        tokens = set(words)
+        tokens.update(
+            word[:-len(suffix)] for word in words for suffix in _TOKEN_SUFFIXES
+            if word.endswith(suffix) and len(word) > len(suffix)
+        )
+        
         # Enhanced balance check
-        if any(word in message_lower for word in self.intent_patterns["get_balance"]):
+        if self._matches_intent("get_balance", tokens, message_lower):
             return {
                 "intent": "get_balance",
                 "parameters": {},
@@ -452,7 +985,7 @@ Your new balance will be updated shortly.
             }
         
         # Enhanced price check with market context
-        elif any(word in message_lower for word in self.intent_patterns["get_price"]):
+        elif self._matches_intent("get_price", tokens, message_lower):
             symbol = self._extract_symbol(message)
             return {
                 "intent": "get_price",
@@ -464,7 +997,7 @@ Your new balance will be updated shortly.
             }
         
         # Enhanced send transaction with confirmation
-        elif any(word in message_lower for word in self.intent_patterns["send_transaction"]):
+        elif self._matches_intent("send_transaction", tokens, message_lower):
             params = self._enhanced_extract_send_parameters(message)
             return {
                 "intent": "send_transaction",
@@ -472,11 +1005,11 @@ Your new balance will be updated shortly.
                 "confidence": 0.7 if params else 0.4,
                 "response_message": self._create_send_confirmation_message(params),
                 "requires_confirmation": True if params else False,
-                "explorer_links": [f"https://shannon-explorer.somnia.network/address/{params.get('to_address', '')}"] if params.get('to_address') else []
+                "explorer_links": [_EXPLORER_ADDRESS_PREFIX + params['to_address']] if params.get('to_address') else []
             }
         
         # Enhanced help with context
-        elif any(word in message_lower for word in self.intent_patterns["help"]):
+        elif self._matches_intent("help", tokens, message_lower):
             return {
                 "intent": "help",
                 "parameters": {},
@@ -486,7 +1019,7 @@ Your new balance will be updated shortly.
             }
         
         # Gas price check
-        elif any(word in message_lower for word in self.intent_patterns["gas_price"]):
+        elif self._matches_intent("gas_price", tokens, message_lower):
             return {
                 "intent": "gas_price",
                 "parameters": {},
@@ -503,37 +1036,28 @@ Your new balance will be updated shortly.
                 "confidence": 0.5,
                 "response_message": "I'm not quite sure what you'd like to do. Here's what I can help you with:",
                 "requires_confirmation": False,
-                "suggested_actions": ["check_balance", "get_price", "send_transaction", "view_help"]
+                "suggested_actions": _FALLBACK_ACTIONS
             }
     
+    def _matches_intent(self, intent: str, tokens: set, message_lower: str) -> bool:
+        """Check whether a message matches an intent's keywords"""
+        return (not tokens.isdisjoint(self._intent_words[intent])
+                or any(phrase in message_lower for phrase in self._intent_phrases[intent]))
+    
     def _enhanced_extract_send_parameters(self, message: str) -> Dict[str, Any]:
-        """Enhanced parameter extraction for send transactions"""
+        """Enhanced parameter extraction for send transactions, in a single regex pass"""
         params = {}
         
-        # Extract amount and symbol with better patterns
-        amount_patterns = [
-            r'(\d+\.?\d*)\s*(SOMI|STT|ETH|BTC)',
-            r'send\s+(\d+\.?\d*)\s*(SOMI|STT|ETH|BTC)',
-            r'transfer\s+(\d+\.?\d*)\s*(SOMI|STT|ETH|BTC)',
-            r'(\d+\.?\d*)\s*(SOMI|STT|ETH|BTC)\s+to'
-        ]
-        
-        for pattern in amount_patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                params["amount"] = float(match.group(1))
-                params["symbol"] = match.group(2).upper()
-                break
-        
-        # Extract address with better validation
-        address_pattern = r'0x[a-fA-F0-9]{40}'
-        address_match = re.search(address_pattern, message)
-        if address_match:
-            params["to_address"] = address_match.group(0)
-        
-        # Extract additional context
-        if "all" in message.lower() or "everything" in message.lower():
-            params["send_all"] = True
+        # First amount and first address win
+        for match in _SEND_RE.finditer(message):
+            kind = match.lastgroup
+            if kind == "address":
+                params.setdefault("to_address", match.group("address"))
+            elif kind == "symbol" and "amount" not in params:
+                params["amount"] = float(match.group("amount"))
+                params["symbol"] = match.group("symbol").upper()
+            elif kind == "send_all":
+                params["send_all"] = True
         
         return params
     
@@ -542,83 +1066,105 @@ Your new balance will be updated shortly.
         if not params or not params.get('amount') or not params.get('to_address'):
             return "I'd like to help you send a transaction. Please specify the amount, cryptocurrency, and recipient address. Example: 'Send 10 STT to 0x1a2b3c4d...'"
         
-        return self.response_templates["send_confirmation"].format(
-            amount=params['amount'],
-            symbol=params.get('symbol', 'STT'),
-            to_address=params['to_address'],
-            from_address="[Your Wallet]"
-        )
+        return self._tmpl["send_confirmation"]({
+            "amount": params['amount'],
+            "symbol": params.get('symbol', 'STT'),
+            "to_address": params['to_address'],
+            "from_address": "[Your Wallet]"
+        })
     
     def _extract_symbol(self, message: str) -> str:
         """Extract cryptocurrency symbol from message"""
-        message_upper = message.upper()
-        
-        if 'SOMI' in message_upper:
-            return 'SOMI'
-        elif 'STT' in message_upper:
-            return 'STT'
-        elif 'ETH' in message_upper or 'ETHER' in message_upper.upper():
-            return 'ETH'
-        elif 'BTC' in message_upper or 'BITCOIN' in message_upper.upper():
-            return 'BTC'
-        else:
-            return 'SOMI'  # Default to SOMI
+        match = _SYMBOL_RE.search(message)
+        return _SYMBOL_MAP[match.group(1).upper()] if match else 'SOMI'  # Default to SOMI
     
     async def _execute_enhanced_action(self, ai_data: Dict[str, Any], wallet_address: str = None, context: Dict = None) -> Dict[str, Any]:
         """Execute enhanced action with confirmation flows and explorer integration"""
         intent = ai_data.get("intent")
         parameters = ai_data.get("parameters", {})
         
-        logger.info(f"🎯 Executing enhanced intent: {intent} with params: {parameters}")
+        logger.info("🎯 Executing enhanced intent: %s with params: %s", intent, parameters)
         
         try:
-            if intent == "get_balance":
-                return await self._handle_enhanced_get_balance(wallet_address, context)
-            
-            elif intent == "send_transaction":
-                return await self._handle_enhanced_send_transaction(parameters, wallet_address, context)
-            
-            elif intent == "create_wallet":
-                return await self._handle_enhanced_create_wallet(context)
-            
-            elif intent == "get_price":
-                return await self._handle_enhanced_get_price(parameters, context)
+            # Unknown intents get the help guide
+            handler = self._action_dispatch.get(intent, self._action_dispatch["help"])
+            result = handler(parameters, wallet_address, context)
+            return await result if asyncio.iscoroutine(result) else result
             
-            elif intent == "gas_price":
-                return await self._handle_enhanced_gas_price(context)
-            
-            elif intent == "help":
-                return self._handle_enhanced_help(context)
-            
-            else:
-                return self._handle_enhanced_help(context)
-                
         except Exception as e:
-            logger.error(f"❌ Enhanced action execution error: {str(e)}")
+            logger.error("❌ Enhanced action execution error: %s", e)
             return self._create_error_response(str(e))
     
+    async def _get_token_price(self, symbol: str) -> Dict[str, Any]:
+        """Get token price data, cached for a few seconds"""
+        return await self._get_cached_price_data(
+            f"price:{symbol.lower()}", _PRICE_CACHE_TTL,
+            lambda: self.wallet_core.get_enhanced_token_price(symbol)
+        )
+    
+    async def _get_gas_prices(self) -> Dict[str, Any]:
+        """Get network gas prices, cached for a few seconds"""
+        return await self._get_cached_price_data("gas", _GAS_CACHE_TTL, self.wallet_core.get_gas_prices)
+    
+    async def _get_cached_price_data(self, key: str, ttl: float, fetch) -> Dict[str, Any]:
+        """Serve price data from the TTL cache, fetching it once per key on a miss"""
+        cached = self._price_cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            self._price_cache.move_to_end(key)
+            return cached[1]
+        
+        return await self._price_fetches.run(key, functools.partial(self._fetch_price_data, key, fetch))
+    
+    async def _fetch_price_data(self, key: str, fetch) -> Dict[str, Any]:
+        """Fetch price data and store it in the TTL cache"""
+        data = await fetch()
+        self._price_cache[key] = (time.monotonic(), data)
+        self._price_cache.move_to_end(key)
+        if len(self._price_cache) > _PRICE_CACHE_SIZE:
+            self._price_cache.popitem(last=False)
+        return data
+    
+    def _invalidate_price_cache(self):
+        """Drop cached token/gas prices, e.g. after a transaction changes network state"""
+        self._price_cache.clear()
+    
+    async def _prefetch_market(self, symbol: str) -> Dict[str, Any]:
+        """Fetch token price and gas prices concurrently; failed lookups are None"""
+        price_data, gas_data = await asyncio.gather(
+            self._get_token_price(symbol),
+            self._get_gas_prices(),
+            return_exceptions=True
+        )
+        return {
+            "symbol": symbol,
+            "price": None if isinstance(price_data, BaseException) else price_data,
+            "gas": None if isinstance(gas_data, BaseException) else gas_data
+        }
+    
+    async def _get_prefetched_market(self, context: Dict = None) -> Optional[Dict[str, Any]]:
+        """Get the speculative market prefetch started for this message, if any"""
+        market_prefetch = context.get("_market_prefetch") if context else None
+        if market_prefetch is None or market_prefetch.cancelled():
+            return None
+        return await market_prefetch
+    
     async def _handle_enhanced_get_balance(self, wallet_address: str, context: Dict = None) -> Dict[str, Any]:
         """Enhanced balance check with explorer integration"""
         if not wallet_address:
-            return {
-                "response": "Please connect your wallet or create a new one to check your balance.",
-                "success": False,
-                "action": "get_balance",
-                "suggested_actions": ["create_wallet", "connect_wallet"]
-            }
+            return dict(_ERROR_TEMPLATES["wallet_required"])
         
         try:
             balance_wei = self.wallet_core.get_balance(wallet_address)
             balance_ether = self.wallet_core.wei_to_ether(balance_wei)
             
-            explorer_url = f"https://shannon-explorer.somnia.network/address/{wallet_address}"
+            explorer_url = _EXPLORER_ADDRESS_PREFIX + wallet_address
             
             return {
-                "response": self.response_templates["balance"].format(
-                    address=wallet_address,
-                    balance=balance_ether,
-                    symbol="STT"
-                ),
+                "response": self._tmpl["balance"]({
+                    "address": wallet_address,
+                    "balance": balance_ether,
+                    "symbol": "STT"
+                }),
                 "success": True,
                 "action": "get_balance",
                 "data": {
@@ -628,10 +1174,10 @@ Your new balance will be updated shortly.
                     "address": wallet_address
                 },
                 "explorer_links": [explorer_url],
-                "suggested_actions": ["send_transaction", "check_price", "view_transactions"]
+                "suggested_actions": _BALANCE_ACTIONS
             }
         except Exception as e:
-            return self._create_error_response(f"Error checking balance: {str(e)}")
+            return self._create_error_response(f"Error checking balance: {e}")
     
     async def _handle_enhanced_send_transaction(self, parameters: Dict, wallet_address: str, context: Dict = None) -> Dict[str, Any]:
         """Enhanced send transaction with confirmation flow"""
@@ -640,12 +1186,7 @@ Your new balance will be updated shortly.
         symbol = parameters.get("symbol", "STT")
         
         if not amount or not to_address:
-            return {
-                "response": "To send a transaction, I need both the amount and recipient address. Please provide details like: 'Send 10 STT to 0x1a2b3c4d...'",
-                "success": False,
-                "action": "send_transaction",
-                "requires_confirmation": False
-            }
+            return dict(_ERROR_TEMPLATES["send_details_required"])
         
         # Create enhanced transaction data with explorer preview
         transaction_data = {
@@ -656,123 +1197,117 @@ Your new balance will be updated shortly.
             "network": "Somnia Testnet",
             "chain_id": 50312,
             "estimated_gas": "21000",  # Default gas limit
-            "explorer_url": f"https://shannon-explorer.somnia.network/address/{to_address}"
+            "explorer_url": _EXPLORER_ADDRESS_PREFIX + to_address
         }
         
-        return {
-            "response": self.response_templates["send_confirmation"].format(
-                amount=amount,
-                symbol=symbol,
-                to_address=to_address,
-                from_address=wallet_address
-            ),
-            "success": True,
-            "action": "send_transaction",
-            "transaction_data": transaction_data,
-            "requires_confirmation": True,
-            "explorer_links": [transaction_data["explorer_url"]],
-            "suggested_actions": ["confirm_transaction", "cancel_transaction", "edit_amount"]
-        }
+        response = dict(_SEND_CONFIRM_PROTO)
+        response["response"] = self._tmpl["send_confirmation"]({
+            "amount": amount,
+            "symbol": symbol,
+            "to_address": to_address,
+            "from_address": wallet_address
+        })
+        response["transaction_data"] = transaction_data
+        response["explorer_links"] = (transaction_data["explorer_url"],)
+        return response
     
     async def _handle_enhanced_create_wallet(self, context: Dict = None) -> Dict[str, Any]:
         """Enhanced wallet creation with security emphasis"""
         try:
-            wallet_info = self.wallet_core.create_wallet()
+            wallet_info = await self.wallet_core.create_wallet_async()
             
-            explorer_url = f"https://shannon-explorer.somnia.network/address/{wallet_info['address']}"
+            explorer_url = _EXPLORER_ADDRESS_PREFIX + wallet_info['address']
             
             return {
-                "response": self.response_templates["wallet_created"].format(
-                    address=wallet_info["address"],
-                    private_key=wallet_info["private_key"],
-                    mnemonic=wallet_info["mnemonic"]
-                ),
+                "response": self._tmpl["wallet_created"]({
+                    "address": wallet_info["address"],
+                    "private_key": wallet_info["private_key"],
+                    "mnemonic": wallet_info["mnemonic"]
+                }),
                 "success": True,
                 "action": "create_wallet",
                 "data": wallet_info,
                 "explorer_links": [explorer_url],
                 "requires_confirmation": False,
-                "suggested_actions": ["backup_wallet", "check_balance", "send_transaction"]
+                "suggested_actions": _WALLET_CREATED_ACTIONS
             }
         except Exception as e:
-            return self._create_error_response(f"Error creating wallet: {str(e)}")
+            return self._create_error_response(f"Error creating wallet: {e}")
     
     async def _handle_enhanced_get_price(self, parameters: Dict, context: Dict = None) -> Dict[str, Any]:
         """Enhanced price check with market analysis"""
         try:
             symbol = parameters.get("symbol", "SOMI")
-            price_data = await self.wallet_core.get_enhanced_token_price(symbol)
-            
-            explorer_url = f"https://shannon-explorer.somnia.network/"
+            market = await self._get_prefetched_market(context)
+            if market and market["symbol"] == symbol and market["price"] is not None:
+                price_data = market["price"]
+            else:
+                price_data = await self._get_token_price(symbol)
             
-            return {
-                "response": self.response_templates["price_info"].format(
-                    symbol=symbol,
-                    usd_price=price_data.get("usd", "N/A"),
-                    idr_price=price_data.get("idr", "N/A"),
-                    change_24h=price_data.get("change_24h", "N/A"),
-                    market_cap=price_data.get("market_cap", "N/A"),
-                    volume_24h=price_data.get("volume_24h", "N/A"),
-                    ath=price_data.get("ath", "N/A")
-                ),
-                "success": True,
-                "action": "get_price",
-                "data": price_data,
-                "explorer_links": [explorer_url],
-                "market_insights": price_data.get("insights", {}),
-                "suggested_actions": ["buy_crypto", "compare_exchanges", "market_analysis"]
-            }
+            get_price = price_data.get
+            response = dict(_PRICE_RESPONSE_PROTO)
+            response["response"] = self._tmpl["price_info"]({
+                "symbol": symbol,
+                "usd_price": get_price("usd", "N/A"),
+                "idr_price": get_price("idr", "N/A"),
+                "change_24h": get_price("change_24h", "N/A"),
+                "market_cap": get_price("market_cap", "N/A"),
+                "volume_24h": get_price("volume_24h", "N/A"),
+                "ath": get_price("ath", "N/A")
+            })
+            response["data"] = price_data
+            response["market_insights"] = get_price("insights", {})
+            return response
         except Exception as e:
-            return self._create_error_response(f"Error fetching price: {str(e)}")
+            return self._create_error_response(f"Error fetching price: {e}")
     
     async def _handle_enhanced_gas_price(self, context: Dict = None) -> Dict[str, Any]:
         """Enhanced gas price check"""
         try:
-            gas_data = await self.wallet_core.get_gas_prices()
-            
-            response = f"⛽ **Current Network Gas Prices**\n\n"
-            response += f"• **Current:** {gas_data.get('current', 'N/A')} Gwei\n"
-            response += f"• **Fast:** {gas_data.get('fast', 'N/A')} Gwei\n"
-            response += f"• **Slow:** {gas_data.get('slow', 'N/A')} Gwei\n"
-            response += f"• **Network:** Somnia Testnet\n\n"
-            response += "💡 *Lower gas prices mean slower but cheaper transactions*"
+            market = await self._get_prefetched_market(context)
+            if market and market["gas"] is not None:
+                gas_data = market["gas"]
+            else:
+                gas_data = await self._get_gas_prices()
             
-            return {
-                "response": response,
-                "success": True,
-                "action": "gas_price",
-                "data": gas_data,
-                "requires_confirmation": False,
-                "suggested_actions": ["send_transaction", "check_balance", "get_price"]
-            }
+            get_gas = gas_data.get
+            response = dict(_GAS_RESPONSE_PROTO)
+            response["response"] = (
+                "⛽ **Current Network Gas Prices**\n\n"
+                f"• **Current:** {get_gas('current', 'N/A')} Gwei\n"
+                f"• **Fast:** {get_gas('fast', 'N/A')} Gwei\n"
+                f"• **Slow:** {get_gas('slow', 'N/A')} Gwei\n"
+                "• **Network:** Somnia Testnet\n\n"
+                "💡 *Lower gas prices mean slower but cheaper transactions*"
+            )
+            response["data"] = gas_data
+            return response
         except Exception as e:
-            return self._create_error_response(f"Error fetching gas prices: {str(e)}")
+            return self._create_error_response(f"Error fetching gas prices: {e}")
     
     def _handle_enhanced_help(self, context: Dict = None) -> Dict[str, Any]:
         """Enhanced help with context-aware suggestions"""
-        return {
-            "response": self.response_templates["help"],
-            "success": True,
-            "action": "help",
-            "requires_confirmation": False,
-            "suggested_actions": ["get_balance", "get_price", "send_transaction", "create_wallet"]
-        }
+        return dict(_HELP_RESPONSE)
+    
+    def help_json_bytes(self) -> bytes:
+        """Get the help response as pre-encoded JSON"""
+        return self._help_json
     
     async def _enhanced_fallback_processing(self, message: str, wallet_address: str = None, context: Dict = None) -> Dict[str, Any]:
         """Enhanced fallback processing with better context awareness"""
         # Use the enhanced intent extraction
         fake_ai_response = self._enhanced_intent_extraction(message, context)
-        return await self._execute_enhanced_action(fake_ai_response, wallet_address, context)
+        # Dispatch directly: local intents are always known, and I/O-free
+        # handlers (help) return without an await
+        handler = self._action_dispatch[fake_ai_response["intent"]]
+        result = handler(fake_ai_response["parameters"], wallet_address, context)
+        return await result if asyncio.iscoroutine(result) else result
     
     def _create_error_response(self, error_message: str) -> Dict[str, Any]:
         """Create standardized error response"""
-        return {
-            "response": f"❌ **I encountered an error**\n\n`{error_message}`\n\nPlease try again or contact support if the issue persists.",
-            "success": False,
-            "action": "error",
-            "requires_confirmation": False,
-            "suggested_actions": ["retry", "help", "contact_support"]
-        }
+        response = dict(_ERROR_SKELETON)
+        response["response"] = self._err_fmt(error_message)
+        return response
     
     # Method to handle transaction confirmations from frontend
     async def confirm_transaction(self, transaction_data: Dict, private_key: str = None) -> Dict[str, Any]:
@@ -783,40 +1318,36 @@ Your new balance will be updated shortly.
                 transaction_data, 
                 private_key
             )
-            
-            if result.get("success"):
-                tx_hash = result.get("transaction_hash")
-                explorer_url = f"https://shannon-explorer.somnia.network/tx/{tx_hash}"
-                
-                return {
-                    "response": self.response_templates["send_success"].format(
-                        amount=transaction_data["amount"],
-                        symbol=transaction_data["symbol"],
-                        to_address=transaction_data["to_address"],
-                        tx_hash=tx_hash,
-                        explorer_url=explorer_url
-                    ),
-                    "success": True,
-                    "action": "send_transaction",
-                    "transaction_hash": tx_hash,
-                    "explorer_links": [explorer_url],
-                    "requires_confirmation": False,
-                    "suggested_actions": ["view_on_explorer", "check_balance", "new_transaction"]
-                }
-            else:
-                return {
-                    "response": self.response_templates["send_failed"].format(
-                        error=result.get("error", "Unknown error")
-                    ),
-                    "success": False,
-                    "action": "send_transaction",
-                    "requires_confirmation": False
-                }
-                
         except Exception as e:
-            return self._create_error_response(f"Transaction confirmation failed: {str(e)}")
+            return self._create_error_response(f"Transaction confirmation failed: {e}")
+        
+        ok = result.get("success")
+        tx_hash = result.get("transaction_hash") if ok else None
+        err = None if ok else result.get("error", "Unknown error")
+        if ok:
+            # Gas prices and the sender's balance are stale after a send
+            self._invalidate_price_cache()
+            self._balance_cache.pop(transaction_data.get("from_address"), None)
+            explorer_url = _EXPLORER_TX_PREFIX + tx_hash
+            # The transaction is already sent: never fail on a missing display field
+            get_tx = transaction_data.get
+            amount, symbol, to_address = get_tx("amount"), get_tx("symbol", "STT"), get_tx("to_address")
+            
+            response = dict(_SEND_SUCCESS_PROTO)
+            response["response"] = self._tmpl["send_success"]({
+                "amount": amount,
+                "symbol": symbol,
+                "to_address": to_address,
+                "tx_hash": tx_hash,
+                "explorer_url": explorer_url
+            })
+            response["transaction_hash"] = tx_hash
+            response["explorer_links"] = (explorer_url,)
+            return response
+        
+        response = dict(_SEND_FAILED_PROTO)
+        response["response"] = self._tmpl["send_failed"]({"error": err})
+        return response
 
 # Maintain backward compatibility
-class NLPAgent(EnhancedNLPAgent):
-    """Backward compatibility layer"""
-    pass
\ No newline at end of file
+NLPAgent = EnhancedNLPAgent
\ No newline at end of file
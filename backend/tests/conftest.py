@@ -0,0 +1,10 @@
+# backend/tests/conftest.py
+"""
+🧪 Pytest configuration for Senna Wallet backend tests
+"""
+
+import os
+import sys
+
+# Backend modules are imported flat (as main.py does)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
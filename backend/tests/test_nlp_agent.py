@@ -0,0 +1,30 @@
+# backend/tests/test_nlp_agent.py
+"""
+🧪 Local intent extraction tests for the NLP agent
+"""
+
+import pytest
+
+from nlp_agent import EnhancedNLPAgent
+
+
+@pytest.fixture
+def agent():
+    # Intent extraction is pure; no wallet core is needed
+    return EnhancedNLPAgent(wallet_core=None)
+
+
+@pytest.mark.parametrize("message, intent", [
+    ("saldonya berapa", "get_balance"),
+    ("cek saldonya dong", "get_balance"),
+    ("show my balances", "get_balance"),
+    ("harganya berapa", "get_price"),
+    ("tolonglah", "help"),
+])
+def test_extract_intent_matches_word_stems(agent, message, intent):
+    assert agent._extract_intent(message)["intent"] == intent
+
+
+def test_extract_intent_ignores_keywords_inside_other_words(agent):
+    # "gasket" must not match the "gas" keyword
+    assert agent._extract_intent("gasket")["confidence"] == 0.5
\ No newline at end of file